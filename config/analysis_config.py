@@ -5,4 +5,9 @@ RECOVERY_END = "2019-09-30"
 
 SMOOTHING_WINDOW = 3
 
-DATA_FILE = "data/portarthur_sd_df_2019.rdata" 
\ No newline at end of file
+DATA_FILE = "data/portarthur_sd_df_2019.rdata" 
+
+NETWORK_METRICS = ["weighted_degree", "pagerank", "component_share", "cross_county_fraction"]
+PAGERANK_DAMPING = 0.85
+PAGERANK_MAX_ITER = 100
+PAGERANK_TOL = 1e-8
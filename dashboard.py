@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
+from matplotlib.figure import Figure
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
+from io import BytesIO
+import threading
+import time
 import sys
 import os
 
@@ -48,24 +55,379 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def load_and_process_data():
-    with st.spinner("Loading mobility data..."):
-        df = load_data()
+DEFAULT_CBG = "482450063002"
+PREWARM_CBG_COUNT = 5
+BACKGROUND_WORKERS = 4
+
+
+# Shared by every session: each key is computed once and concurrent callers get the same future
+class BackgroundCache:
+    def __init__(self, max_workers=BACKGROUND_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dashboard")
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._inputs = {}
+        self._views = Counter()
+        self.timings = {}
+
+    def get(self, key):
+        with self._lock:
+            return self._futures.get(key)
+
+    def submit(self, key, fn, *deps):
+        with self._lock:
+            existing = self._futures.get(key)
+            if existing is not None and not self._is_stale(key, existing):
+                return existing
+            future = Future()
+            pending = [self._futures[dep] for dep in deps]
+            self._futures[key] = future
+            self._inputs[key] = dict(zip(deps, pending))
+
+        # Only hand work to the pool once its inputs exist, so no worker blocks on another
+        remaining = [len(pending)]
+
+        def on_dep_done(_):
+            with self._lock:
+                remaining[0] -= 1
+                ready = remaining[0] == 0
+            if ready:
+                self._executor.submit(self._run, key, fn, pending, future)
+
+        if not pending:
+            self._executor.submit(self._run, key, fn, pending, future)
+        for dep in pending:
+            dep.add_done_callback(on_dep_done)
+
+        return future
+
+    # A failed result, or one built on an input that has since been replaced, is recomputed
+    # so a rerun retries instead of replaying an error that is still propagating
+    def _is_stale(self, key, future):
+        if future.done() and future.exception() is not None:
+            return True
+        return any(self._futures.get(dep) is not dep_future
+                   for dep, dep_future in self._inputs[key].items())
+
+    def _run(self, key, fn, deps, future):
+        start = time.perf_counter()
+        try:
+            result = fn(*[dep.result() for dep in deps])
+        except Exception as exc:
+            future.set_exception(exc)
+            return
+        self.timings[key] = time.perf_counter() - start
+        future.set_result(result)
+
+    def record_view(self, cbg):
+        with self._lock:
+            self._views[cbg] += 1
+
+    def most_viewed(self, n):
+        with self._lock:
+            return [cbg for cbg, _ in self._views.most_common(n)]
+
+
+@st.cache_resource
+def get_background_cache():
+    return BackgroundCache()
+
+
+def compute_visit_counts(df, start_date='2019-09-01', end_date='2019-09-30'):
+    df_visits = df[['date', 'origin_census_block_group', 'destination_cbg', 'destination_device_count']].copy()
+    df_visits['date'] = pd.to_datetime(df_visits['date'])
+    df_visits = df_visits[(df_visits['date'] >= start_date) & (df_visits['date'] <= end_date)]
+
+    origin = df_visits['origin_census_block_group']
+    destination = df_visits['destination_cbg']
+    df_visits['visit_type'] = np.select(
+        [origin == destination, origin.str[:5] != destination.str[:5]],
+        ['own', 'inward'],
+        default='outward'
+    )
+
+    return df_visits.groupby(['date', 'visit_type'])['destination_device_count'].sum().reset_index()
+
+
+def render_cbg_figure(cbg, inflow_df, resilience_df):
+    cbg_data = resilience_df[resilience_df['cbg'] == cbg].iloc[0]
+
+    cbg_mobility = inflow_df[inflow_df['destination_cbg'] == cbg].copy()
+    cbg_mobility = cbg_mobility[(cbg_mobility['date'] >= '2019-09-01') &
+                               (cbg_mobility['date'] <= '2019-09-30')].sort_values('date')
+
+    # Figure rather than pyplot: pyplot's global state is not safe to use off the main thread
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+
+    ax.plot(cbg_mobility['date'], cbg_mobility['normalized_inflow'],
+           linewidth=2, label='Normalized Inflow')
+    ax.axhline(cbg_data['baseline'], color='gray', linestyle='--', label='Baseline')
+    ax.axvline(cbg_data['t0'], color='orange', linestyle=':', label='Disaster Start')
+    ax.axvline(cbg_data['tD'], color='red', linestyle=':', label='Maximum Impact')
+    ax.axvline(cbg_data['t1'], color='green', linestyle=':', label='Recovery')
+
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Normalized Inflow')
+    ax.set_title(f'CBG {cbg} - Resilience Pattern')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    # Cache the rendered image so concurrent sessions never draw the same figure
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def submit_cbg_figure(cache, cbg):
+    return cache.submit(('cbg_figure', cbg), partial(render_cbg_figure, cbg), 'inflow', 'resilience')
+
+
+def prewarm_cbg_figures(cache, resilience_df):
+    if resilience_df.empty:
+        return []
+
+    # The CBGs a user is most likely to open: the default selection, the ones listed in the
+    # top/bottom tables, and those other sessions have switched to
+    cbgs = [DEFAULT_CBG] if (resilience_df['cbg'] == DEFAULT_CBG).any() else []
+    cbgs += resilience_df.nlargest(PREWARM_CBG_COUNT, 'resilience_ratio')['cbg'].tolist()
+    cbgs += resilience_df.nsmallest(PREWARM_CBG_COUNT, 'resilience_ratio')['cbg'].tolist()
+    cbgs += cache.most_viewed(PREWARM_CBG_COUNT)
+
+    cbgs = list(dict.fromkeys(cbgs))
+    for cbg in cbgs:
+        submit_cbg_figure(cache, cbg)
+    return cbgs
+
+
+def start_pipeline(cache):
+    cache.submit('data', load_data)
+    cache.submit('visits', compute_visit_counts, 'data')
+    cache.submit('inflow', process_mobility_data, 'data')
+    cache.submit('resilience', calculate_resilience_for_all_cbgs, 'inflow')
+    cache.submit('summary', get_resilience_summary, 'resilience')
+    cache.submit('cbg_figures', partial(prewarm_cbg_figures, cache), 'resilience')
+
+
+def wait_for(future, message):
+    if not future.done():
+        with st.spinner(message):
+            return future.result()
+    return future.result()
+
+
+def pending_section(message):
+    placeholder = st.empty()
+    placeholder.info(message)
+    return placeholder
+
+
+def render_section(placeholder, render, *futures):
+    # A failed stage only replaces its own section, so the others still render
+    try:
+        results = [future.result() for future in futures]
+        with placeholder.container():
+            render(*results)
+    except Exception as exc:
+        placeholder.exception(exc)
+
+
+def render_resilience_summary(summary):
+    st.subheader("Resilience Summary")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="Average Resilience", 
+            value=f"{summary['resilience_ratio']['mean']:.3f}",
+            help="Mean resilience ratio (higher = more resilient)"
+        )
+        
+    with col2:
+        st.metric(
+            label="Avg Disruption",
+            value=f"{summary['avg_disruption_days']:.1f} days",
+            help="Average recovery time"
+        )
+        
+    with col3:
+        st.metric(
+            label="Most Resilient",
+            value=f"{summary['resilience_ratio']['max']:.3f}",
+            help="Highest resilience ratio achieved"
+        )
+        
+    with col4:
+        st.metric(
+            label="Resilience Range", 
+            value=f"{summary['resilience_ratio']['min']:.3f} - {summary['resilience_ratio']['max']:.3f}",
+            help="Range of resilience ratios"
+        )
+
+
+def render_visit_patterns(visit_counts):
+    st.subheader("Visit Patterns")
     
-    with st.spinner("Processing mobility patterns..."):
-        inflow_df = process_mobility_data(df)
+    # Create plotly line chart
+    fig = px.line(
+        visit_counts, 
+        x='date', 
+        y='destination_device_count',
+        color='visit_type',
+        title='Time Series of Visits in Port Arthur',
+        labels={
+            'date': 'Date',
+            'destination_device_count': 'Number of Visits',
+            'visit_type': 'Visit Type'
+        }
+    )
     
-    with st.spinner("Calculating resilience metrics..."):
-        resilience_df = calculate_resilience_for_all_cbgs(inflow_df)
+    # Add shaded impact window
+    fig.add_vrect(
+        x0='2019-09-17', x1='2019-09-19',
+        fillcolor='gray', opacity=0.3,
+        annotation_text="Impact Window", annotation_position="top left"
+    )
     
-    return df, inflow_df, resilience_df
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_cbg_analysis(cache, resilience_df):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Most Resilient CBGs")
+        top_cbgs = resilience_df.nlargest(5, 'resilience_ratio')[['cbg', 'resilience_ratio', 'total_disruption_days']]
+        st.dataframe(top_cbgs, hide_index=True)
+    
+    with col2:
+        st.subheader("Least Resilient CBGs") 
+        bottom_cbgs = resilience_df.nsmallest(5, 'resilience_ratio')[['cbg', 'resilience_ratio', 'total_disruption_days']]
+        st.dataframe(bottom_cbgs, hide_index=True)
+    
+    st.subheader("Individual CBG Analysis")
+    cbg_options = sorted(resilience_df['cbg'].unique())
+    default_index = cbg_options.index(DEFAULT_CBG) if DEFAULT_CBG in cbg_options else 0
+    
+    selected_cbg = st.selectbox(
+        "Select a Census Block Group for detailed analysis:",
+        options=cbg_options,
+        index=default_index,
+        help="Choose a CBG to see its detailed resilience pattern"
+    )
+    
+    if selected_cbg:
+        # Only count selection changes, not the default a new session starts on
+        if 'last_viewed_cbg' not in st.session_state:
+            st.session_state['last_viewed_cbg'] = selected_cbg
+        elif st.session_state['last_viewed_cbg'] != selected_cbg:
+            st.session_state['last_viewed_cbg'] = selected_cbg
+            cache.record_view(selected_cbg)
+
+        cbg_data = resilience_df[resilience_df['cbg'] == selected_cbg].iloc[0]
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Resilience Ratio", f"{cbg_data['resilience_ratio']:.3f}")
+        with col2:
+            st.metric("Days to Impact", f"{cbg_data['days_to_impact']}")
+        with col3:
+            st.metric("Days to Recovery", f"{cbg_data['days_to_recovery']}")
+        
+        st.subheader(f"Mobility Pattern for CBG {selected_cbg}")
+        st.image(
+            wait_for(submit_cbg_figure(cache, selected_cbg), "Rendering mobility pattern..."),
+            use_container_width=True
+        )
+
+
+def render_resilience_patterns(resilience_df, summary):
+    st.subheader("Resilience Distribution")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.histogram(
+            resilience_df, 
+            x='resilience_ratio',
+            nbins=30,
+            title='Distribution of Resilience Ratios',
+            labels={'resilience_ratio': 'Resilience Ratio', 'count': 'Number of CBGs'}
+        )
+        fig.add_vline(x=summary['resilience_ratio']['mean'], line_dash="dash", 
+                     annotation_text=f"Mean: {summary['resilience_ratio']['mean']:.3f}")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.box(
+            resilience_df, 
+            y='resilience_ratio',
+            title='Resilience Ratio Distribution',
+            labels={'resilience_ratio': 'Resilience Ratio'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.subheader("Vulnerability Distribution")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.histogram(
+            resilience_df, 
+            x='vulnerability',
+            nbins=30,
+            title='Distribution of Vulnerability',
+            labels={'vulnerability': 'Vulnerability', 'count': 'Number of CBGs'}
+        )
+        fig.add_vline(x=resilience_df['vulnerability'].mean(), line_dash="dash", 
+                     annotation_text=f"Mean: {resilience_df['vulnerability'].mean():.3f}")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.box(
+            resilience_df, 
+            y='vulnerability',
+            title='Vulnerability Distribution',
+            labels={'vulnerability': 'Vulnerability'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.subheader("Robustness Distribution")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.histogram(
+            resilience_df, 
+            x='robustness',
+            nbins=30,
+            title='Distribution of Robustness',
+            labels={'robustness': 'Robustness', 'count': 'Number of CBGs'}
+        )
+        fig.add_vline(x=resilience_df['robustness'].mean(), line_dash="dash", 
+                     annotation_text=f"Mean: {resilience_df['robustness'].mean():.3f}")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.box(
+            resilience_df, 
+            y='robustness',
+            title='Robustness Distribution',
+            labels={'robustness': 'Robustness'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
 
 def main():
+    page_start = time.perf_counter()
+    cache = get_background_cache()
+    start_pipeline(cache)
+    visits_future = cache.get('visits')
+    resilience_future = cache.get('resilience')
+    summary_future = cache.get('summary')
+    data_future = cache.get('data')
+
     st.markdown('<h1 class="main-header">Community Resilience Dashboard</h1>', unsafe_allow_html=True)
     st.markdown('<h3 style="text-align: left; color: #666;">Port Arthur, Texas - Tropical Storm Imelda Analysis</h3>', unsafe_allow_html=True)
     
-    df, inflow_df, resilience_df = load_and_process_data()
-    summary = get_resilience_summary(resilience_df)
+    df = wait_for(data_future, "Loading mobility data...")
     
     tab1, tab2, tab3 = st.tabs([
         "Overview", 
@@ -82,218 +444,48 @@ def main():
         with col1:
             st.metric("Total Mobility Records", f"{len(df):,}")
         with col2:
-            st.metric("Census Block Groups", f"{inflow_df['destination_cbg'].nunique()}")
+            st.metric("Census Block Groups", f"{df['destination_cbg'].nunique()}")
         with col3:
             st.metric("Analysis Period", "Jan 1 - Dec 31, 2019")
         with col4:
-            st.metric("CBGs Analyzed", summary['total_cbgs'])
-        
-        st.subheader("Resilience Summary")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                label="Average Resilience", 
-                value=f"{summary['resilience_ratio']['mean']:.3f}",
-                help="Mean resilience ratio (higher = more resilient)"
-            )
-            
-        with col2:
-            st.metric(
-                label="Avg Disruption",
-                value=f"{summary['avg_disruption_days']:.1f} days",
-                help="Average recovery time"
-            )
-            
-        with col3:
-            st.metric(
-                label="Most Resilient",
-                value=f"{summary['resilience_ratio']['max']:.3f}",
-                help="Highest resilience ratio achieved"
-            )
-            
-        with col4:
-            st.metric(
-                label="Resilience Range", 
-                value=f"{summary['resilience_ratio']['min']:.3f} - {summary['resilience_ratio']['max']:.3f}",
-                help="Range of resilience ratios"
-            )
-        
-        st.subheader("Visit Patterns")
-        
-        # Create visit patterns plot for Streamlit
-        df_visits = df.copy()
-        df_visits['date'] = pd.to_datetime(df_visits['date'])
-        df_visits = df_visits[(df_visits['date'] >= '2019-09-01') & (df_visits['date'] <= '2019-09-30')]
-        
-        # Define visit types
-        df_visits['visit_type'] = df_visits.apply(
-            lambda row: 'own' if row['origin_census_block_group'] == row['destination_cbg']
-            else 'inward' if row['origin_census_block_group'][:5] != row['destination_cbg'][:5]
-            else 'outward',
-            axis=1
-        )
+            cbgs_analyzed = st.empty()
+            cbgs_analyzed.metric("CBGs Analyzed", "...")
         
-        # Aggregate
-        visit_counts = df_visits.groupby(['date', 'visit_type'])['destination_device_count'].sum().reset_index()
+        first_paint = time.perf_counter() - page_start
+        st.caption(f"Time to first paint: {first_paint:.2f}s")
         
-        # Create plotly line chart
-        fig = px.line(
-            visit_counts, 
-            x='date', 
-            y='destination_device_count',
-            color='visit_type',
-            title='Time Series of Visits in Port Arthur',
-            labels={
-                'date': 'Date',
-                'destination_device_count': 'Number of Visits',
-                'visit_type': 'Visit Type'
-            }
-        )
-        
-        # Add shaded impact window
-        fig.add_vrect(
-            x0='2019-09-17', x1='2019-09-19',
-            fillcolor='gray', opacity=0.3,
-            annotation_text="Impact Window", annotation_position="top left"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        summary_section = pending_section("Calculating resilience metrics...")
+        visits_section = pending_section("Aggregating visit patterns...")
     
     with tab2:
         st.header("CBG Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Most Resilient CBGs")
-            top_cbgs = resilience_df.nlargest(5, 'resilience_ratio')[['cbg', 'resilience_ratio', 'total_disruption_days']]
-            st.dataframe(top_cbgs, hide_index=True)
-        
-        with col2:
-            st.subheader("Least Resilient CBGs") 
-            bottom_cbgs = resilience_df.nsmallest(5, 'resilience_ratio')[['cbg', 'resilience_ratio', 'total_disruption_days']]
-            st.dataframe(bottom_cbgs, hide_index=True)
-        
-        st.subheader("Individual CBG Analysis")
-        cbg_options = sorted(resilience_df['cbg'].unique())
-        default_cbg = "482450063002"
-        default_index = cbg_options.index(default_cbg) if default_cbg in cbg_options else 0
-        
-        selected_cbg = st.selectbox(
-            "Select a Census Block Group for detailed analysis:",
-            options=cbg_options,
-            index=default_index,
-            help="Choose a CBG to see its detailed resilience pattern"
-        )
-        
-        if selected_cbg:
-            cbg_data = resilience_df[resilience_df['cbg'] == selected_cbg].iloc[0]
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Resilience Ratio", f"{cbg_data['resilience_ratio']:.3f}")
-            with col2:
-                st.metric("Days to Impact", f"{cbg_data['days_to_impact']}")
-            with col3:
-                st.metric("Days to Recovery", f"{cbg_data['days_to_recovery']}")
-            
-            st.subheader(f"Mobility Pattern for CBG {selected_cbg}")
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            cbg_mobility = inflow_df[inflow_df['destination_cbg'] == selected_cbg].copy()
-            cbg_mobility = cbg_mobility[(cbg_mobility['date'] >= '2019-09-01') & 
-                                       (cbg_mobility['date'] <= '2019-09-30')].sort_values('date')
-            
-            ax.plot(cbg_mobility['date'], cbg_mobility['normalized_inflow'], 
-                   linewidth=2, label='Normalized Inflow')
-            ax.axhline(cbg_data['baseline'], color='gray', linestyle='--', label='Baseline')
-            ax.axvline(cbg_data['t0'], color='orange', linestyle=':', label='Disaster Start')
-            ax.axvline(cbg_data['tD'], color='red', linestyle=':', label='Maximum Impact')
-            ax.axvline(cbg_data['t1'], color='green', linestyle=':', label='Recovery')
-            
-            ax.set_xlabel('Date')
-            ax.set_ylabel('Normalized Inflow')
-            ax.set_title(f'CBG {selected_cbg} - Resilience Pattern')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            st.pyplot(fig)
+        cbg_section = pending_section("Calculating resilience metrics...")
     
     with tab3:
         st.header("Resilience Patterns")
-        
-        st.subheader("Resilience Distribution")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.histogram(
-                resilience_df, 
-                x='resilience_ratio',
-                nbins=30,
-                title='Distribution of Resilience Ratios',
-                labels={'resilience_ratio': 'Resilience Ratio', 'count': 'Number of CBGs'}
-            )
-            fig.add_vline(x=summary['resilience_ratio']['mean'], line_dash="dash", 
-                         annotation_text=f"Mean: {summary['resilience_ratio']['mean']:.3f}")
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.box(
-                resilience_df, 
-                y='resilience_ratio',
-                title='Resilience Ratio Distribution',
-                labels={'resilience_ratio': 'Resilience Ratio'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.subheader("Vulnerability Distribution")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.histogram(
-                resilience_df, 
-                x='vulnerability',
-                nbins=30,
-                title='Distribution of Vulnerability',
-                labels={'vulnerability': 'Vulnerability', 'count': 'Number of CBGs'}
-            )
-            fig.add_vline(x=resilience_df['vulnerability'].mean(), line_dash="dash", 
-                         annotation_text=f"Mean: {resilience_df['vulnerability'].mean():.3f}")
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.box(
-                resilience_df, 
-                y='vulnerability',
-                title='Vulnerability Distribution',
-                labels={'vulnerability': 'Vulnerability'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.subheader("Robustness Distribution")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.histogram(
-                resilience_df, 
-                x='robustness',
-                nbins=30,
-                title='Distribution of Robustness',
-                labels={'robustness': 'Robustness', 'count': 'Number of CBGs'}
-            )
-            fig.add_vline(x=resilience_df['robustness'].mean(), line_dash="dash", 
-                         annotation_text=f"Mean: {resilience_df['robustness'].mean():.3f}")
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            fig = px.box(
-                resilience_df, 
-                y='robustness',
-                title='Robustness Distribution',
-                labels={'robustness': 'Robustness'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        patterns_section = pending_section("Calculating resilience metrics...")
+    
+    sections = {
+        visits_future: [
+            (visits_section, render_visit_patterns, visits_future)
+        ],
+        summary_future: [
+            (cbgs_analyzed, lambda summary: st.metric("CBGs Analyzed", summary['total_cbgs']), summary_future),
+            (summary_section, render_resilience_summary, summary_future),
+            (patterns_section, render_resilience_patterns, resilience_future, summary_future),
+            # Last, since it may wait on a figure that was not pre-warmed
+            (cbg_section, partial(render_cbg_analysis, cache), resilience_future)
+        ]
+    }
+    for future in as_completed(sections):
+        for section in sections[future]:
+            render_section(*section)
+    
+    with tab1:
+        with st.expander("Load timings"):
+            st.write(f"Full page: {time.perf_counter() - page_start:.2f}s")
+            for key, seconds in list(cache.timings.items()):
+                st.write(f"{key}: {seconds:.2f}s")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
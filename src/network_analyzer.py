@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from config.analysis_config import NETWORK_METRICS, PAGERANK_DAMPING, PAGERANK_MAX_ITER, PAGERANK_TOL
+from src.mobility_processor import apply_smoothing, normalize_inflow
+from src.resilience_calculator import calculate_resilience_for_all_cbgs
+
+
+def build_daily_graphs(df):
+    codes, nodes = pd.factorize(
+        pd.concat([df["origin_census_block_group"], df["destination_cbg"]], ignore_index=True),
+        sort=True,
+    )
+    origin_idx = codes[: len(df)]
+    dest_idx = codes[len(df):]
+    weights = df["destination_device_count"].to_numpy(dtype=float)
+
+    day_codes, days = pd.factorize(pd.to_datetime(df["date"]), sort=True)
+    order = np.argsort(day_codes, kind="stable")
+    bounds = np.searchsorted(day_codes[order], np.arange(len(days) + 1))
+
+    n = len(nodes)
+    graphs = {}
+    for i, day in enumerate(days):
+        rows = order[bounds[i]:bounds[i + 1]]
+        # Duplicate origin/destination pairs are summed when converting to CSR
+        graphs[day] = sparse.csr_matrix(
+            (weights[rows], (origin_idx[rows], dest_idx[rows])), shape=(n, n)
+        )
+
+    return np.asarray(nodes), graphs
+
+
+def compute_pagerank(adj, damping=None, max_iter=None, tol=None):
+    if damping is None:
+        damping = PAGERANK_DAMPING
+    if max_iter is None:
+        max_iter = PAGERANK_MAX_ITER
+    if tol is None:
+        tol = PAGERANK_TOL
+
+    n = adj.shape[0]
+    out_strength = np.asarray(adj.sum(axis=1)).ravel()
+    dangling = out_strength == 0
+    inv_strength = np.zeros(n)
+    inv_strength[~dangling] = 1.0 / out_strength[~dangling]
+    transition_t = (sparse.diags(inv_strength) @ adj).T.tocsr()
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        new_rank = damping * (transition_t @ rank + rank[dangling].sum() / n) + (1 - damping) / n
+        converged = np.abs(new_rank - rank).sum() < tol
+        rank = new_rank
+        if converged:
+            break
+
+    return rank
+
+
+def compute_graph_metrics(adj, counties):
+    n = adj.shape[0]
+    coo = adj.tocoo()
+
+    inflow = np.bincount(coo.col, weights=coo.data, minlength=n)
+    cross = counties[coo.row] != counties[coo.col]
+    cross_inflow = np.bincount(coo.col[cross], weights=coo.data[cross], minlength=n)
+    cross_county_fraction = np.divide(cross_inflow, inflow, out=np.full(n, np.nan), where=inflow > 0)
+
+    # Trips that start and end in the same CBG say nothing about connectivity
+    links = coo.row != coo.col
+    links = sparse.csr_matrix((coo.data[links], (coo.row[links], coo.col[links])), shape=(n, n))
+    weighted_degree = np.asarray(links.sum(axis=0)).ravel() + np.asarray(links.sum(axis=1)).ravel()
+
+    pagerank = np.zeros(n)
+    component_share = np.zeros(n)
+    active = np.flatnonzero(weighted_degree > 0)
+    if len(active) > 0:
+        subgraph = links[active][:, active]
+        # Scale by the number of active CBGs so a uniform rank is 1 on every day
+        pagerank[active] = compute_pagerank(subgraph) * len(active)
+        _, labels = connected_components(subgraph, directed=True, connection="weak")
+        component_share[active] = np.bincount(labels)[labels] / len(active)
+
+    return {
+        "weighted_degree": weighted_degree,
+        "pagerank": pagerank,
+        "component_share": component_share,
+        "cross_county_fraction": cross_county_fraction,
+    }
+
+
+def compute_daily_network_metrics(df):
+    nodes, graphs = build_daily_graphs(df)
+    counties = pd.Series(nodes).str[:5].to_numpy()
+    is_destination = np.isin(nodes, df["destination_cbg"].unique())
+
+    frames = []
+    for day, adj in graphs.items():
+        metrics = compute_graph_metrics(adj, counties)
+        frame = pd.DataFrame({"date": day, "destination_cbg": nodes[is_destination]})
+        for metric, values in metrics.items():
+            frame[metric] = values[is_destination]
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def prepare_metric_series(metrics_df, metric, smoothing_window=None):
+    # Reuse the inflow smoothing and normalization so the resilience triangle sees the same input shape
+    series_df = metrics_df[["date", "destination_cbg", metric]].rename(columns={metric: "inflow"})
+    series_df = apply_smoothing(series_df, window=smoothing_window)
+    series_df = normalize_inflow(series_df)
+
+    # Constant series (e.g. a CBG that never leaves the main component) have no triangle to measure
+    return series_df.dropna(subset=["normalized_inflow"])
+
+
+def calculate_network_resilience(metrics_df, metrics=None, smoothing_window=None, baseline_start=None,
+                                 baseline_end=None, disaster_start=None, recovery_end=None):
+    if metrics is None:
+        metrics = NETWORK_METRICS
+
+    results = []
+    for metric in metrics:
+        print(f"Network metric: {metric}")
+        series_df = prepare_metric_series(metrics_df, metric, smoothing_window=smoothing_window)
+        resilience_df = calculate_resilience_for_all_cbgs(
+            series_df,
+            baseline_start=baseline_start,
+            baseline_end=baseline_end,
+            disaster_start=disaster_start,
+            recovery_end=recovery_end
+        )
+        results.append(resilience_df.assign(metric=metric))
+
+    return pd.concat(results, ignore_index=True)
+
+
+if __name__ == "__main__":
+    from src.data_loader import load_data
+
+    print("Loading mobility data...")
+    df = load_data()
+
+    print("\nBuilding daily mobility graphs...")
+    metrics_df = compute_daily_network_metrics(df)
+    print(f"Network metrics shape: {metrics_df.shape}")
+    print(f"Columns: {list(metrics_df.columns)}")
+
+    print("\nSample network metrics:")
+    print(metrics_df.head())
+
+    print("\nCalculating network resilience...")
+    network_resilience_df = calculate_network_resilience(metrics_df)
+
+    print("\nAverage resilience ratio by metric:")
+    print(network_resilience_df.groupby("metric")["resilience_ratio"].mean())